@@ -0,0 +1,56 @@
+import argparse
+import datetime
+import random
+import timeit
+
+from . import exporter, updater
+
+
+def strptime_start_time(value):
+    parsed = datetime.datetime.strptime(value, "%m/%d/%Y %I:%M:%S %p")
+    return int(parsed.replace(tzinfo=datetime.timezone.utc).timestamp())
+
+
+def generate_start_times(count, seed=0):
+    rng = random.Random(seed)
+    start = datetime.datetime(2014, 1, 1)
+    values = []
+    for _ in range(count):
+        moment = start + datetime.timedelta(
+            days=rng.randrange(365 * 10), seconds=rng.randrange(86400)
+        )
+        hour = moment.hour % 12 or 12
+        meridiem = "PM" if moment.hour >= 12 else "AM"
+        values.append(
+            f"{moment.month}/{moment.day}/{moment.year} "
+            f"{hour}:{moment.minute:02}:{moment.second:02} {meridiem}"
+        )
+    return values
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def main():
+    args = get_args()
+    values = generate_start_times(args.count)
+
+    expected = [strptime_start_time(value) for value in values]
+    assert updater.parse_start_times(values) == expected
+    assert [exporter.parse_start_time(value) for value in values] == expected
+
+    candidates = {
+        "strptime": lambda: [strptime_start_time(value) for value in values],
+        "parse_start_times": lambda: updater.parse_start_times(values),
+    }
+    for name, func in candidates.items():
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"{name:>20}: {best * 1000:8.2f} ms for {len(values)} timestamps")
+
+
+if __name__ == "__main__":
+    main()
@@ -54,18 +54,42 @@ gamemode_normalize = {
 }
 
 
+_START_TIME_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+_START_TIME_PATTERN = re.compile(
+    r"(\d{1,2}/\d{1,2}/\d{4}) (\d{1,2}):(\d{2}):(\d{2}) ([AP]M)"
+)
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_start_date(date):
+    month, day, year = map(int, date.split("/"))
+    return (datetime.date(year, month, day).toordinal() - _EPOCH_ORDINAL) * 86400
+
+
+def parse_start_time(value):
+    match = _START_TIME_PATTERN.fullmatch(value)
+    if match:
+        date, hour, minute, second, meridiem = match.groups()
+        hour, minute, second = int(hour), int(minute), int(second)
+        if 1 <= hour <= 12 and minute < 60 and second < 60:
+            hour = hour % 12 + (12 if meridiem == "PM" else 0)
+            return _parse_start_date(date) + hour * 3600 + minute * 60 + second
+    # anything unusual goes through strptime so errors and edge cases match
+    parsed = datetime.datetime.strptime(value, _START_TIME_FORMAT)
+    return int(parsed.replace(tzinfo=datetime.timezone.utc).timestamp())
+
+
 def clean_description(desc):
     return re.sub(r"((?<=:)(?=[^ ])|\s+)", " ", desc.replace("\u2019", "'")).strip()
 
 
-def clean_motd(motd):
+def clean_motd(motd, start_time=None):
     clean = {}
 
-    parsed_time = datetime.datetime.strptime(
-        motd["startDateTime"], "%m/%d/%Y %I:%M:%S %p"
-    )
-    parsed_time = parsed_time.replace(tzinfo=datetime.timezone.utc)
-    clean["startTime"] = int(parsed_time.timestamp())
+    if start_time is None:
+        start_time = parse_start_time(motd["startDateTime"])
+    clean["startTime"] = int(start_time)
 
     if motd["name"] != motd["title"]:
         clean["internalName"] = motd["name"]
@@ -201,12 +225,12 @@ def scan_table(table):
 
 
 def handler(_event=None, _context=None):
-    items = scan_table(get_table())
-    motds = sorted(
-        (clean_motd(json.loads(item["value"])) for item in items),
-        key=lambda x: x["startTime"],
+    # table keys are already the parsed start times, so order and clean by them
+    items = sorted(
+        ((int(item["key"]), item["value"]) for item in scan_table(get_table())),
         reverse=True,
     )
+    motds = [clean_motd(json.loads(value), start_time=key) for key, value in items]
     data = {"motds": motds, "gods": get_gods()}
 
     boto3.client("s3").put_object(
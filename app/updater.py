@@ -3,6 +3,7 @@ import enum
 import functools
 import json
 import os
+import re
 
 import boto3
 
@@ -25,13 +26,41 @@ def get_table(env=None):
     return dynamodb.Table(Config.DDB_TABLE_NAME.from_env(env))
 
 
-def convert_motd_details_to_dynamodb_item(details):
-    parsed = datetime.datetime.strptime(
-        details["startDateTime"], "%m/%d/%Y %I:%M:%S %p"
-    )
-    parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+_START_TIME_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+_START_TIME_PATTERN = re.compile(
+    r"(\d{1,2}/\d{1,2}/\d{4}) (\d{1,2}):(\d{2}):(\d{2}) ([AP]M)"
+)
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_start_date(date):
+    month, day, year = map(int, date.split("/"))
+    return (datetime.date(year, month, day).toordinal() - _EPOCH_ORDINAL) * 86400
+
+
+def parse_start_time(value):
+    match = _START_TIME_PATTERN.fullmatch(value)
+    if match:
+        date, hour, minute, second, meridiem = match.groups()
+        hour, minute, second = int(hour), int(minute), int(second)
+        if 1 <= hour <= 12 and minute < 60 and second < 60:
+            hour = hour % 12 + (12 if meridiem == "PM" else 0)
+            return _parse_start_date(date) + hour * 3600 + minute * 60 + second
+    # anything unusual goes through strptime so errors and edge cases match
+    parsed = datetime.datetime.strptime(value, _START_TIME_FORMAT)
+    return int(parsed.replace(tzinfo=datetime.timezone.utc).timestamp())
+
+
+def parse_start_times(values):
+    return [parse_start_time(value) for value in values]
+
+
+def convert_motd_details_to_dynamodb_item(details, key=None):
+    if key is None:
+        key = parse_start_time(details["startDateTime"])
     return {
-        "key": int(parsed.timestamp()),
+        "key": key,
         "value": json.dumps(details, separators=(",", ":"), sort_keys=True),
     }
 
@@ -46,7 +75,12 @@ def get_smite_motds():
 
 
 def handler(_event=None, _context=None):
-    items = [convert_motd_details_to_dynamodb_item(motd) for motd in get_smite_motds()]
+    motds = get_smite_motds()
+    keys = parse_start_times(motd["startDateTime"] for motd in motds)
+    items = [
+        convert_motd_details_to_dynamodb_item(motd, key)
+        for motd, key in zip(motds, keys)
+    ]
 
     requires_export = False
 